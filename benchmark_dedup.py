@@ -94,12 +94,13 @@ def benchmark_deduplication():
     print("\n" + "=" * 70)
     print("性能优化说明:")
     print("=" * 70)
-    print("1. 预计算优化: 每篇文章的shingles只计算一次")
-    print("2. 快速过滤: 文本长度差异>50%时直接跳过相似度计算")
-    print("3. 使用3-shingles: 比单词集合更准确地捕捉上下文")
-    print("4. 集合运算: 使用Python内置集合操作，C语言级别优化")
-    print("\n理论时间复杂度: O(n²) 最坏情况")
-    print("实际时间复杂度: O(n·m) 其中 m << n (通过快速过滤)")
+    print("1. 预计算优化: 每篇文章的shingles和MinHash签名只计算一次")
+    print("2. MinHash-LSH: 64个哈希分成16个band，只有band相同的文章才成为候选对")
+    print("3. 大小过滤: 候选对shingle数量之比低于阈值时直接跳过（不影响结果）")
+    print("4. 使用3-shingles: 比单词集合更准确地捕捉上下文")
+    print("5. 集合运算: 候选对使用Python内置集合操作计算精确Jaccard相似度")
+    print("\n候选生成时间复杂度: O(n)")
+    print("精确比较时间复杂度: O(n·m) 其中 m 为每篇文章的候选数 (m << n)")
     print("=" * 70)
 
 
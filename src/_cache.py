@@ -0,0 +1,55 @@
+"""
+Content-addressed on-disk cache for derived data.
+
+Entries are pickles named after a hash of the input they were derived from,
+so a changed input simply misses and stale entries are never served.
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+
+def content_key(data: bytes, namespace: str = "") -> str:
+    """Return the cache key for *data*.
+
+    Args:
+        data: Raw input the cached value is derived from
+        namespace: Mixed into the hash; change it to invalidate every entry
+            (e.g. when the parser's output format changes)
+
+    Returns:
+        Hex digest usable as a file name
+    """
+    digest = hashlib.sha1(namespace.encode("utf-8"))
+    digest.update(data)
+    return digest.hexdigest()
+
+
+def get(cache_dir: Path, key: str):
+    """Return the value stored under *key*, or None on a miss.
+
+    Unreadable, truncated or otherwise corrupt entries count as misses.
+    """
+    try:
+        with open(cache_dir / f"{key}.pickle", "rb") as fh:
+            return pickle.load(fh)
+    except Exception:  # pylint: disable=broad-except
+        # A damaged pickle can fail in many ways (OverflowError, ValueError,
+        # TypeError, ...); any of them just means the value is rebuilt
+        return None
+
+
+def put(cache_dir: Path, key: str, value) -> None:
+    """Store *value* under *key*.
+
+    Written to a temp file and renamed into place, so concurrent readers
+    never load a partial entry.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    path = cache_dir / f"{key}.pickle"
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as fh:
+        pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
@@ -13,6 +13,14 @@ from pathlib import Path
 
 MAX_RECENT_KNOWLEDGE_GRAPHS = 10
 
+# English day/month names indexed by weekday() and month - 1, so the
+# per-digest loops avoid a locale-aware strftime call for each entry
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
 
 def find_digest_files(docs_dir: Path) -> list[tuple[datetime, str]]:
     """Find all digest markdown files in docs directory.
@@ -73,7 +81,7 @@ def generate_index_content(digests: list[tuple[datetime, str]], docs_dir: Path |
     recent_section = []
     for i, (date, path) in enumerate(recent_digests):
         date_str = date.strftime('%Y-%m-%d')
-        day_name = date.strftime('%A')
+        day_name = _WEEKDAYS[date.weekday()]
 
         # Create link with emoji indicator for latest
         emoji = "🌟" if i == 0 else "📰"
@@ -90,7 +98,7 @@ def generate_index_content(digests: list[tuple[datetime, str]], docs_dir: Path |
     archive_by_period = {}
     for date, path in digests:
         year = date.year
-        month = date.strftime('%B')  # Full month name
+        month = _MONTHS[date.month - 1]
         key = f"{year}-{date.month:02d}"
         display = f"{month} {year}"
 
@@ -273,7 +281,7 @@ def generate_archive_index(digests: list[tuple[datetime, str]]) -> str:
     archive_by_period = {}
     for date, path in digests:
         year = date.year
-        month = date.strftime('%B')  # Full month name
+        month = _MONTHS[date.month - 1]
         key = f"{year}-{date.month:02d}"
         display = f"{month} {year}"
 
@@ -368,13 +376,13 @@ def generate_period_index(year: int, month: int, period_digests: list[tuple[date
     Returns:
         Full content of period index.md as string
     """
-    month_name = datetime(year, month, 1).strftime('%B')
+    month_name = _MONTHS[month - 1]
 
     # Build digest list
     digest_section = []
     for date, path in period_digests:
         date_str = date.strftime('%Y-%m-%d')
-        day_name = date.strftime('%A')
+        day_name = _WEEKDAYS[date.weekday()]
 
         digest_path = docs_dir / path
         period_dir = docs_dir / 'archive' / str(year) / f"{month:02d}"
@@ -6,55 +6,114 @@ This script scans daily digest markdown files and creates summaries
 that aggregate key information from the news articles collected.
 
 Usage:
-    python src/generate_summary.py
+    python src/generate_summary.py [--force]
+
+A month's summary is only rebuilt when its set of digests changed since it was
+written: a digest was added, edited, or moved (e.g. into the archive, which
+changes the summary's links), or SUMMARY_FORMAT_VERSION was bumped.  Pass
+--force to rebuild every summary regardless.
 """
 
+import bisect
+import hashlib
+import io
+import itertools
 import os
 import re
+import sys
 from datetime import datetime
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
+import _cache
 
-def parse_digest_file(file_path: Path) -> dict:
-    """Parse a digest markdown file to extract key information.
+# Number of period summaries rendered and written concurrently
+SUMMARY_WRITE_WORKERS = 8
 
-    Args:
-        file_path: Path to the digest markdown file
+# Below this many digests, parsing in-process beats starting worker processes
+PARSE_POOL_MIN_PATHS = 4
 
-    Returns:
-        Dictionary with parsed information including:
-        - date: Date of the digest
-        - categories: Categories covered
-        - sources: List of sources
-        - article_count: Total number of articles
-        - articles_by_category: Articles organized by category
+# Digest files are named YYYY-MM-DD.md
+_DIGEST_NAME_RE = re.compile(r'(\d{4}-\d{2}-\d{2})\.md')
+
+# An article's summary is the first "> " line within this many lines after
+# its "#### N. Title" header
+SUMMARY_LOOKAHEAD = 9
+
+# Written next to each summary.md: a SUMMARY_FORMAT_VERSION header, then the
+# digests it was built from, one "<path relative to docs>\t<sha1 of content>"
+# line each.  Dot-named so the Jekyll build does not publish it
+SUMMARY_MANIFEST_NAME = '.summary-digests'
+
+# First line of every manifest; bump it whenever generate_period_summary's
+# output changes so summaries rendered by an older template are rebuilt
+SUMMARY_FORMAT_VERSION = 'summary-v1'
+
+# Namespace of the parse cache keys; bump it whenever the parser's output
+# changes so entries written by an older parser are never loaded
+PARSE_CACHE_VERSION = 'digest-parse-v1'
+
+# Digest headers the parser cares about, combined into one pattern:
+#   "#### 1. Article Title"                      -> article
+#   "### 📰 TechCrunch {#techcrunch}"             -> source
+#   "## 🔬 Technology & AI {#technology-ai}"      -> category
+_LINE_RE = re.compile(
+    r'^(?:####\s+\d+\.\s+(?P<article>.+)'
+    r'|###\s+📰\s+(?P<source>.+?)\s+\{#.+\}'
+    r'|##\s+(?P<category>.+?)\s+\{#.+\})'
+)
+
+
+def _parse_date(date_str: str) -> datetime:
+    """Parse a ``YYYY-MM-DD`` string by slicing, skipping strptime's format walk.
+
+    Raises:
+        ValueError: If the string is not a valid calendar date
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
 
-    # Extract date from filename
-    filename = file_path.name
-    date_match = re.match(r'(\d{4}-\d{2}-\d{2})\.md', filename)
-    if not date_match:
-        return None
 
-    date_str = date_match.group(1)
-    date = datetime.strptime(date_str, '%Y-%m-%d')
+def _parse_digest_lines(lines) -> tuple[dict, int]:
+    """Collect categories, sources and articles from the lines of a digest.
+
+    Args:
+        lines: Iterable of lines, newline included (e.g. an open file)
 
-    # Extract categories and articles
+    Returns:
+        Tuple (categories, article_count); see :func:`parse_digest_file`
+    """
     categories = {}
     current_category = None
     current_source = None
     article_count = 0
 
-    # Parse content line by line
-    lines = content.split('\n')
+    # Articles still looking for their summary: the first "> " line among the
+    # next SUMMARY_LOOKAHEAD lines, as (article, index of the last line to check)
+    pending = []
+
     for i, line in enumerate(lines):
-        # Match category headers (e.g., "## 🔬 Technology & AI {#technology-ai}")
-        category_match = re.match(r'^##\s+(.+?)\s+\{#.+\}', line)
-        if category_match:
-            current_category = category_match.group(1).strip()
+        if pending:
+            if line.startswith('> '):
+                summary = line[2:].strip()
+                for article, _ in pending:
+                    article['summary'] = summary
+                pending.clear()
+            elif pending[0][1] <= i:
+                pending = [entry for entry in pending if entry[1] > i]
+
+        # Only header lines are interesting; skip everything else cheaply
+        if not line.startswith('#'):
+            continue
+        match = _LINE_RE.match(line)
+        if not match:
+            continue
+        kind = match.lastgroup
+
+        if kind == 'category':
+            # Interned so the same name is one shared object across digests,
+            # which keeps period-level aggregation lookups on the identity fast path
+            current_category = sys.intern(match.group('category').strip())
             if current_category not in ['📸 Cover', '📑 Table of Contents', '📌 About This Digest']:
                 categories[current_category] = {
                     'sources': [],
@@ -62,32 +121,96 @@ def parse_digest_file(file_path: Path) -> dict:
                 }
             continue
 
-        # Match source headers (e.g., "### 📰 TechCrunch {#techcrunch}")
-        source_match = re.match(r'^###\s+📰\s+(.+?)\s+\{#.+\}', line)
-        if source_match and current_category and current_category in categories:
-            current_source = source_match.group(1).strip()
+        if not (current_category and current_category in categories):
+            continue
+
+        if kind == 'source':
+            current_source = sys.intern(match.group('source').strip())
             if current_source not in categories[current_category]['sources']:
                 categories[current_category]['sources'].append(current_source)
             continue
 
-        # Match article headers (e.g., "#### 1. Article Title")
-        article_match = re.match(r'^####\s+\d+\.\s+(.+)', line)
-        if article_match and current_category and current_category in categories:
-            article_title = article_match.group(1).strip()
-
-            # Try to find the summary (quoted text on next few lines)
-            summary = ""
-            for j in range(i+1, min(i+10, len(lines))):
-                if lines[j].startswith('> '):
-                    summary = lines[j][2:].strip()
-                    break
-
-            categories[current_category]['articles'].append({
-                'title': article_title,
-                'summary': summary,
-                'source': current_source
-            })
-            article_count += 1
+        article = {
+            'title': match.group('article').strip(),
+            'summary': "",
+            'source': current_source
+        }
+        categories[current_category]['articles'].append(article)
+        pending.append((article, i + SUMMARY_LOOKAHEAD))
+        article_count += 1
+
+    return categories, article_count
+
+
+def _intern_names(categories: dict) -> dict:
+    """Return *categories* with its category and source names interned.
+
+    :func:`_parse_digest_lines` interns these names, but pickling (cache
+    entries, results from worker processes) hands back separate copies.
+    """
+    interned = {}
+    for category, info in categories.items():
+        for article in info['articles']:
+            if article['source'] is not None:
+                article['source'] = sys.intern(article['source'])
+        info['sources'] = [sys.intern(source) for source in info['sources']]
+        interned[sys.intern(category)] = info
+    return interned
+
+
+def _content_hash(data: bytes) -> str:
+    """Return the SHA-1 hex digest of a digest file's content."""
+    return hashlib.sha1(data).hexdigest()
+
+
+def parse_digest_file(file_path: Path, cache_dir: Path | None = None, content_hash: str | None = None) -> dict:
+    """Parse a digest markdown file to extract key information.
+
+    Args:
+        file_path: Path to the digest markdown file
+        cache_dir: Directory of the parse cache; when given, a digest whose
+            content was parsed before is loaded from there instead
+        content_hash: :func:`_content_hash` of the file, if the caller already
+            has it; a cache hit then never reads the file
+
+    Returns:
+        Dictionary with parsed information including:
+        - date: Date of the digest
+        - categories: Categories covered
+        - sources: List of sources
+        - article_count: Total number of articles
+        - articles_by_category: Articles organized by category
+    """
+    # Extract date from filename before touching the file
+    filename = file_path.name
+    date_match = _DIGEST_NAME_RE.match(filename)
+    if not date_match:
+        return None
+
+    date_str = date_match.group(1)
+    date = _parse_date(date_str)
+
+    if cache_dir is None:
+        # Stream the file line by line; only the pending window is kept around
+        with open(file_path, 'r', encoding='utf-8', buffering=1 << 16) as f:
+            categories, article_count = _parse_digest_lines(f)
+    else:
+        # Keyed by content, so an edited digest misses and is parsed again
+        data = None
+        if content_hash is None:
+            data = file_path.read_bytes()
+            content_hash = _content_hash(data)
+        key = _cache.content_key(content_hash.encode('ascii'), PARSE_CACHE_VERSION)
+        parsed = _cache.get(cache_dir, key)
+        if parsed is None:
+            if data is None:
+                data = file_path.read_bytes()
+            parsed = _parse_digest_lines(io.StringIO(data.decode('utf-8'), newline=None))
+            _cache.put(cache_dir, key, parsed)
+            categories, article_count = parsed
+        else:
+            # Unpickled names are fresh copies; share them again
+            categories, article_count = _intern_names(parsed[0]), parsed[1]
 
     return {
         'date': date,
@@ -98,6 +221,42 @@ def parse_digest_file(file_path: Path) -> dict:
     }
 
 
+def parse_many(
+    paths: list,
+    max_workers: int | None = None,
+    cache_dir: Path | None = None,
+    content_hashes: list | None = None,
+) -> list:
+    """Parse many digest files, spreading the work over worker processes.
+
+    Parsing is CPU-bound string work, so a process pool scales with cores.
+    Small batches, or a single available core, are parsed in-process instead.
+
+    Args:
+        paths: Paths to digest markdown files
+        max_workers: Number of worker processes (default: CPU count)
+        cache_dir: Parse cache directory passed on to :func:`parse_digest_file`
+        content_hashes: Content hash of each path, in the same order, passed
+            on to :func:`parse_digest_file`
+
+    Returns:
+        Parsed digests in input order, without files that are not digests
+    """
+    cache_dirs = itertools.repeat(cache_dir, len(paths))
+    hashes = content_hashes or itertools.repeat(None, len(paths))
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers < 2 or len(paths) < PARSE_POOL_MIN_PATHS:
+        results = map(parse_digest_file, paths, cache_dirs, hashes)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(parse_digest_file, paths, cache_dirs, hashes, chunksize=4))
+        # Results arrive pickled; restore the shared names in this process
+        for digest_info in results:
+            if digest_info is not None:
+                digest_info['categories'] = _intern_names(digest_info['categories'])
+    return [digest_info for digest_info in results if digest_info is not None]
+
+
 def generate_digest_summary(digest_info: dict) -> str:
     """Generate a text summary for a single digest.
 
@@ -132,7 +291,7 @@ def generate_period_summary(period_digests: list[dict], year: int, month: int, d
     """Generate a summary for a specific period (month).
 
     Args:
-        period_digests: List of digest information for the period
+        period_digests: List of digest information for the period, sorted by date
         year: Year
         month: Month (1-12)
         docs_dir: Base docs directory path for computing relative links
@@ -197,10 +356,7 @@ def generate_period_summary(period_digests: list[dict], year: int, month: int, d
         "",
     ])
 
-    # Sort by date
-    sorted_digests = sorted(period_digests, key=lambda d: d['date'])
-
-    for digest in sorted_digests:
+    for digest in period_digests:
         date_str = digest['date_str']
         day_name = digest['date'].strftime('%A')
         article_count = digest['article_count']
@@ -279,8 +435,86 @@ def generate_summary_index(all_summaries: list[tuple[int, int, int]]) -> str:
     return '\n'.join(lines)
 
 
-def main():
-    """Main function to generate summaries."""
+def _write_text_atomic(path: Path, content: str) -> None:
+    """Write *content* to a sibling temp file, then rename it over *path*.
+
+    Readers (e.g. a Jekyll build) see either the old file or the complete new
+    one, never a partially written page.
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_text(content, encoding='utf-8')
+    os.replace(tmp_path, path)
+
+
+def _render_and_write(
+    year: int,
+    month: int,
+    period_digests: list[dict],
+    archive_dir: Path,
+    docs_dir: Path,
+    manifest: str,
+) -> tuple[int, int, int]:
+    """Render the summary for one period and write it to archive/YYYY/MM/summary.md.
+
+    The period's digest *manifest* is written beside it afterwards, so an
+    interrupted run leaves the summary stale rather than wrongly fresh.
+
+    Returns:
+        Tuple (year, month, digest_count) for the summaries index
+    """
+    # Create period directory in archive (not in summaries)
+    period_dir = archive_dir / str(year) / f"{month:02d}"
+    period_dir.mkdir(parents=True, exist_ok=True)
+
+    summary_content = generate_period_summary(period_digests, year, month, docs_dir=docs_dir)
+    summary_path = period_dir / 'summary.md'
+
+    _write_text_atomic(summary_path, summary_content)
+    _write_text_atomic(period_dir / SUMMARY_MANIFEST_NAME, manifest)
+
+    return year, month, len(period_digests)
+
+
+def _digest_manifest(digest_paths: list[Path], docs_dir: Path, content_hashes: dict | None = None) -> str:
+    """Describe the digests a period summary is built from.
+
+    Records where each digest lives, since the summary links to it relative
+    to the period directory, and a hash of its content.  Unlike mtimes, both
+    survive archiving with os.replace and a fresh git checkout.
+
+    The SUMMARY_FORMAT_VERSION header ties the manifest to the template too,
+    so a changed renderer makes every period stale.  *content_hashes* maps
+    each path to its :func:`_content_hash`; it is computed here if not given.
+
+    Returns:
+        The format version, then sorted "<path relative to docs_dir>\t<sha1>" lines
+    """
+    if content_hashes is None:
+        content_hashes = {path: _content_hash(path.read_bytes()) for path in digest_paths}
+    entries = sorted(
+        f"{path.relative_to(docs_dir).as_posix()}\t{content_hashes[path]}"
+        for path in digest_paths
+    )
+    return '\n'.join([SUMMARY_FORMAT_VERSION, *entries]) + '\n'
+
+
+def _summary_is_fresh(summary_path: Path, manifest: str) -> bool:
+    """Return True if *summary_path* exists and was built from the digests in *manifest*."""
+    if not summary_path.exists():
+        return False
+    try:
+        recorded = (summary_path.parent / SUMMARY_MANIFEST_NAME).read_text(encoding='utf-8')
+    except FileNotFoundError:
+        return False
+    return recorded == manifest
+
+
+def main(force: bool = False):
+    """Main function to generate summaries.
+
+    Args:
+        force: Rebuild every period summary, even when its digests are unchanged
+    """
     # Get repository root
     script_dir = Path(__file__).parent
     repo_root = script_dir.parent if script_dir.name == 'src' else script_dir
@@ -292,39 +526,58 @@ def main():
 
     # Find all digest files
     print("Scanning for digest files...")
-    digest_pattern = re.compile(r'^\d{4}-\d{2}-\d{2}\.md$')
-
-    all_digests = []
-
-    # Scan docs root
-    for file in docs_dir.glob('*.md'):
-        if digest_pattern.match(file.name):
-            digest_info = parse_digest_file(file)
-            if digest_info:
-                all_digests.append(digest_info)
 
-    # Scan archive
+    # Collect digest paths from docs root and archive
+    digest_paths = [f for f in docs_dir.glob('*.md') if _DIGEST_NAME_RE.fullmatch(f.name)]
     archive_dir = docs_dir / 'archive'
     if archive_dir.exists():
-        for md_file in archive_dir.rglob('*.md'):
-            if digest_pattern.match(md_file.name):
-                digest_info = parse_digest_file(md_file)
-                if digest_info:
-                    all_digests.append(digest_info)
+        digest_paths.extend(f for f in archive_dir.rglob('*.md') if _DIGEST_NAME_RE.fullmatch(f.name))
 
-    print(f"Found {len(all_digests)} digest files")
+    digest_count = len(digest_paths)
+    print(f"Found {digest_count} digest files")
 
-    if not all_digests:
+    if not digest_count:
         print("No digest files found")
         return 1
 
-    # Group by year/month
+    # Group digest paths by (year, month) using the date in the filename
+    paths_by_period = defaultdict(list)
+    for path in digest_paths:
+        paths_by_period[(int(path.name[:4]), int(path.name[5:7]))].append(path)
+
+    # Periods whose summary.md was built from exactly the same digests, at the
+    # same locations, are left as-is.  Each digest is hashed once: the hash
+    # serves both the manifests and the parse cache keys
+    content_hashes = {path: _content_hash(path.read_bytes()) for path in digest_paths}
+    all_summaries = []
+    stale_paths = []
+    manifests = {}
+    for (year, month), period_paths in paths_by_period.items():
+        summary_path = archive_dir / str(year) / f"{month:02d}" / 'summary.md'
+        manifest = _digest_manifest(period_paths, docs_dir, content_hashes)
+        if not force and _summary_is_fresh(summary_path, manifest):
+            all_summaries.append((year, month, len(period_paths)))
+        else:
+            stale_paths.extend(period_paths)
+            manifests[(year, month)] = manifest
+
+    if all_summaries:
+        print(f"Skipping {len(all_summaries)} up-to-date period(s)")
+
+    # Parse each stale digest and group it by (year, month) in a single pass,
+    # keeping every period list sorted by date as digests are inserted
     digests_by_period = defaultdict(list)
-    for digest in all_digests:
-        year = digest['date'].year
-        month = digest['date'].month
-        key = (year, month)
-        digests_by_period[key].append(digest)
+    parsed = parse_many(
+        stale_paths,
+        cache_dir=repo_root / '.cache' / 'digests',
+        content_hashes=[content_hashes[path] for path in stale_paths],
+    )
+    for digest_info in parsed:
+        bisect.insort(
+            digests_by_period[(digest_info['date'].year, digest_info['date'].month)],
+            digest_info,
+            key=lambda d: d['date'],
+        )
 
     # Create summaries directory structure
     summaries_dir = archive_dir / 'summaries'
@@ -332,37 +585,44 @@ def main():
 
     # Generate summaries for each period
     print("\nGenerating period summaries...")
-    all_summaries = []
 
-    for (year, month), period_digests in digests_by_period.items():
-        # Create period directory in archive (not in summaries)
-        period_dir = archive_dir / str(year) / f"{month:02d}"
-        period_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate summary
-        summary_content = generate_period_summary(period_digests, year, month, docs_dir=docs_dir)
-        summary_path = period_dir / 'summary.md'
-
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            f.write(summary_content)
-
-        print(f"  ✅ Generated summary for {year}-{month:02d} ({len(period_digests)} digests)")
-        all_summaries.append((year, month, len(period_digests)))
+    with ThreadPoolExecutor(max_workers=SUMMARY_WRITE_WORKERS) as executor:
+        futures = [
+            executor.submit(
+                _render_and_write, year, month, period_digests, archive_dir, docs_dir, manifests[(year, month)]
+            )
+            for (year, month), period_digests in digests_by_period.items()
+        ]
+        for future in as_completed(futures):
+            year, month, count = future.result()
+            print(f"  ✅ Generated summary for {year}-{month:02d} ({count} digests)")
+            all_summaries.append((year, month, count))
 
     # Generate main summaries index
     print("\nGenerating summaries index...")
     summaries_index_content = generate_summary_index(all_summaries)
     summaries_index_path = summaries_dir / 'index.md'
 
-    with open(summaries_index_path, 'w', encoding='utf-8') as f:
-        f.write(summaries_index_content)
+    _write_text_atomic(summaries_index_path, summaries_index_content)
 
     print(f"✅ Successfully generated {summaries_index_path}")
     print(f"   - Total periods: {len(all_summaries)}")
-    print(f"   - Total digests: {len(all_digests)}")
+    print(f"   - Total digests: {digest_count}")
 
     return 0
 
 
 if __name__ == '__main__':
-    exit(main())
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Generate monthly summaries for the daily news digests."
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild every period summary, even if its digests are unchanged",
+    )
+    args = parser.parse_args()
+
+    exit(main(force=args.force))
@@ -0,0 +1,14 @@
+"""
+Shared pytest configuration for the tests/ directory.
+
+Makes the src package importable without an install step.  pytest loads this
+file before collecting any test module, so the path is set up exactly once
+per session (and once per worker under pytest-xdist).
+"""
+
+import sys
+from pathlib import Path
+
+_SRC_DIR = str(Path(__file__).parent.parent / "src")
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
@@ -0,0 +1,39 @@
+"""
+Synthetic article corpora shared by the dedup tests and benchmark.
+"""
+
+import random
+
+
+def build_corpus(num_articles, dup_rate=0.1, seed=42, num_sources=17):
+    """Return ``(articles_by_source, links)`` for ``num_articles`` random articles.
+
+    Each story is spread round-robin over *num_sources* regular sources.  About
+    ``dup_rate`` of the stories are repeated, lightly reworded, in a trailing
+    "Aggregator" source, in the same order as their originals.  *links* lists
+    the link of every original.
+    """
+    rng = random.Random(seed)
+    vocab = [f"word{i}" for i in range(5000)]
+    articles_by_source = {f"Source{i}": {"articles": [], "categories": ["tech"]} for i in range(num_sources)}
+    aggregator = []
+    links = []
+    i = 0
+    while len(links) + len(aggregator) < num_articles:
+        title = " ".join(rng.choice(vocab) for _ in range(8))
+        summary = " ".join(rng.choice(vocab) for _ in range(25))
+        link = f"http://source.example.com/{i}"
+        articles_by_source[f"Source{i % num_sources}"]["articles"].append(
+            {"title": title, "link": link, "summary": summary, "published": ""}
+        )
+        links.append(link)
+        if len(links) + len(aggregator) < num_articles and rng.random() < dup_rate:
+            aggregator.append({
+                "title": title,
+                "link": f"http://aggregator.example.com/{i}",
+                "summary": f"{summary.rsplit(' ', 1)[0]} {rng.choice(vocab)}",
+                "published": "",
+            })
+        i += 1
+    articles_by_source["Aggregator"] = {"articles": aggregator, "categories": ["tech"]}
+    return articles_by_source, links
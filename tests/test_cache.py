@@ -0,0 +1,43 @@
+"""
+Tests for src/_cache.py
+
+Run with:  pytest tests/
+"""
+
+import _cache
+
+
+class TestContentKey:
+    def test_depends_on_data_and_namespace(self):
+        key = _cache.content_key(b"digest", "v1")
+        assert key == _cache.content_key(b"digest", "v1")
+        assert key != _cache.content_key(b"digest!", "v1")
+        assert key != _cache.content_key(b"digest", "v2")
+
+
+class TestGetPut:
+    def test_round_trip(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        _cache.put(cache_dir, "k", {"articles": [1, 2, 3]})
+
+        assert _cache.get(cache_dir, "k") == {"articles": [1, 2, 3]}
+        # Nothing but the entry itself is left behind
+        assert [p.name for p in cache_dir.iterdir()] == ["k.pickle"]
+
+    def test_missing_entry_is_a_miss(self, tmp_path):
+        assert _cache.get(tmp_path / "absent", "k") is None
+
+    def test_truncated_entry_is_a_miss(self, tmp_path):
+        (tmp_path / "k.pickle").write_bytes(b"\x80")
+        assert _cache.get(tmp_path, "k") is None
+
+    def test_corrupted_entry_is_a_miss(self, tmp_path):
+        _cache.put(tmp_path, "k", {"articles": list(range(100))})
+        entry = tmp_path / "k.pickle"
+        data = bytearray(entry.read_bytes())
+        # Flipping the top byte of the frame length makes pickle.load raise
+        # OverflowError rather than UnpicklingError
+        data[10] ^= 0xFF
+        entry.write_bytes(bytes(data))
+
+        assert _cache.get(tmp_path, "k") is None
@@ -4,62 +4,78 @@ Tests for src/collector.py
 Run with:  pytest tests/
 """
 
-import sys
+import errno
+import io
+import json
+import os
+import re
 import textwrap
+import threading
+import uuid
+from collections import namedtuple
 from datetime import datetime, timezone
-from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
-import yaml
 
-# Make the src package importable without an install step
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from collector import (  # noqa: E402
+from collector import (
+    _TAG_RE,
     _strip_html,
     _truncate,
     _generate_shingles,
+    _hash_shingle,
+    _jaccard_sets,
     _calculate_similarity,
+    _calculate_similarity_matrix,
     _deduplicate_articles,
+    _minhash_signature,
+    _MINHASH_NUM_PERM,
     _get_daily_cover_image,
     archive_old_files,
+    Article,
     fetch_rss,
+    fetch_rss_many,
     generate_markdown,
     load_config,
     collect_news,
 )
+from corpus import build_corpus
 
 
 # ---------------------------------------------------------------------------
 # Unit tests – pure helpers
 # ---------------------------------------------------------------------------
 
-class TestStripHtml:
-    def test_removes_tags(self):
-        assert _strip_html("<p>Hello <b>world</b></p>") == "Hello world"
-
-    def test_unescapes_entities(self):
-        assert _strip_html("AT&amp;T &lt;ticker&gt;") == "AT&T <ticker>"
+@pytest.mark.parametrize("raw, expected", [
+    ("<p>Hello <b>world</b></p>", "Hello world"),  # removes tags
+    ("AT&amp;T &lt;ticker&gt;", "AT&T <ticker>"),  # unescapes entities
+    ("plain text", "plain text"),                  # plain text unchanged
+    ("a  \n  b", "a b"),                           # collapses whitespace
+    ("line<br>break", "line break"),               # tags separate words
+])
+def test_strip_html(raw, expected):
+    assert _strip_html(raw) == expected
 
-    def test_plain_text_unchanged(self):
-        assert _strip_html("plain text") == "plain text"
 
-    def test_collapses_whitespace(self):
-        assert _strip_html("a  \n  b") == "a b"
+def test_strip_html_regex_precompiled():
+    # The tag pattern is compiled once at import, not looked up per call
+    assert isinstance(_TAG_RE, re.Pattern)
+    assert _TAG_RE.sub(" ", "<p>x</p>") == " x "
 
 
-class TestTruncate:
-    def test_short_string_unchanged(self):
-        assert _truncate("short", 300) == "short"
+@pytest.mark.parametrize("text, max_chars, expected", [
+    ("short", 300, "short"),                 # short string unchanged
+    ("a" * 400, 300, "a" * 300 + "…"),       # 300 chars + ellipsis character
+    ("x" * 300, 300, "x" * 300),             # exact boundary
+])
+def test_truncate(text, max_chars, expected):
+    assert _truncate(text, max_chars) == expected
 
-    def test_long_string_truncated(self):
-        result = _truncate("a" * 400, 300)
-        assert len(result) == 301  # 300 chars + ellipsis character
-        assert result.endswith("…")
 
-    def test_exact_boundary(self):
-        s = "x" * 300
-        assert _truncate(s, 300) == s
+def test_truncate_returns_short_text_itself():
+    # Summaries within the limit are the common case: no copy is made
+    text = "x" * 300
+    assert _truncate(text, 300) is text
 
 
 class TestGetDailyCoverImage:
@@ -102,28 +118,21 @@ class TestGetDailyCoverImage:
 # Shingles and Similarity Tests
 # ---------------------------------------------------------------------------
 
-class TestGenerateShingles:
-    def test_basic_shingles(self):
-        text = "machine learning is great"
-        shingles = _generate_shingles(text, k=2)
-        assert "machine learning" in shingles
-        assert "learning is" in shingles
-        assert "is great" in shingles
-        assert len(shingles) == 3
-
-    def test_short_text(self):
-        text = "hello"
-        shingles = _generate_shingles(text, k=3)
-        assert shingles == {"hello"}
+@pytest.mark.parametrize("text, k, expected", [
+    ("machine learning is great", 2, {"machine learning", "learning is", "is great"}),
+    ("hello", 3, {"hello"}),                           # short text -> single shingle
+    ("", 3, set()),                                    # empty text
+    ("Machine Learning", 3, {"machine learning"}),     # lowercase normalization
+])
+def test_generate_shingles(text, k, expected):
+    assert _generate_shingles(text, k) == {_hash_shingle(shingle) for shingle in expected}
 
-    def test_empty_text(self):
-        shingles = _generate_shingles("", k=3)
-        assert shingles == set()
 
-    def test_lowercase_normalization(self):
-        text1 = "Machine Learning"
-        text2 = "machine learning"
-        assert _generate_shingles(text1) == _generate_shingles(text2)
+def test_generate_shingles_returns_int_set():
+    result = _generate_shingles("machine learning is great")
+    assert isinstance(result, frozenset)
+    assert result and all(isinstance(s, int) for s in result)
+    assert all(0 <= s < 2 ** 64 for s in result)
 
 
 class TestCalculateSimilarity:
@@ -143,9 +152,10 @@ class TestCalculateSimilarity:
         text1 = "Tesla launches new electric car model in China"
         text2 = "Tesla unveils new electric vehicle model in China"
         similarity = _calculate_similarity(text1, text2)
-        # With 3-shingles, similarity is lower but still detectable
-        # These texts share: "model in china" -> 1 common shingle out of more
-        assert similarity > 0.05  # Adjusted expectation
+        # These texts share 1 of 11 distinct 3-shingles ("model in china"),
+        # so the true Jaccard similarity is 1/11; the MinHash estimate has a
+        # standard error of sqrt(J(1-J)/64) ≈ 0.036, allow three of them
+        assert abs(similarity - 1 / 11) < 3 * 0.036
         assert similarity < 0.3   # Not too high since wording differs
 
     def test_word_order_matters(self):
@@ -156,12 +166,48 @@ class TestCalculateSimilarity:
         # Should be less than 1.0 because order is different
         assert similarity < 1.0
 
+    def test_hamming_signature(self):
+        text1 = "alpha beta gamma delta epsilon zeta eta theta iota kappa lambda mu"
+        text2 = "alpha beta gamma delta epsilon zeta eta theta nu xi omicron pi"
+        # 6 shared out of 14 distinct shingles
+        jaccard = 6 / 14
+        sig1 = _minhash_signature(_generate_shingles(text1))
+        sig2 = _minhash_signature(_generate_shingles(text2))
+        assert len(sig1) == len(sig2) == _MINHASH_NUM_PERM
+        # Each lane differs with probability 1 - J, so the Hamming distance is
+        # Binomial(64, 1 - J); accept anything within three standard deviations
+        hamming = sum(a != b for a, b in zip(sig1, sig2))
+        mean = _MINHASH_NUM_PERM * (1 - jaccard)
+        std = (_MINHASH_NUM_PERM * jaccard * (1 - jaccard)) ** 0.5
+        assert abs(hamming - mean) <= 3 * std
+
+    def test_matrix_matches_pairwise(self):
+        texts = [
+            "Tesla launches new electric car model in China",
+            "Tesla unveils new electric vehicle model in China",
+            "Tesla launches new electric car model in China",
+            "",
+            "   ",
+            "hi",
+        ]
+        matrix = _calculate_similarity_matrix(texts)
+        assert len(matrix) == len(texts)
+        for i, text1 in enumerate(texts):
+            assert len(matrix[i]) == len(texts)
+            for j, text2 in enumerate(texts):
+                assert matrix[i][j] == _calculate_similarity(text1, text2)
+
     def test_empty_texts(self):
         assert _calculate_similarity("", "") == 1.0
         assert _calculate_similarity("hello", "") == 0.0
         assert _calculate_similarity("", "world") == 0.0
 
 
+def _article_shingles(article):
+    """Shingle an article the same way _deduplicate_articles does."""
+    return _generate_shingles(f"{article['title']} {article['summary']}")
+
+
 class TestDeduplicateArticles:
     def test_no_duplicates(self):
         articles = {
@@ -199,70 +245,87 @@ class TestDeduplicateArticles:
                 "categories": ["world"]
             }
         }
+        first, second = (data["articles"][0] for data in articles.values())
+        assert _jaccard_sets(_article_shingles(first), _article_shingles(second)) == 1.0
         result = _deduplicate_articles(articles, similarity_threshold=0.7)
         # Should only keep one article
         total_articles = sum(len(data['articles']) for data in result.values())
         assert total_articles == 1
 
-    def test_similar_articles_removed(self):
-        # Use more similar text to ensure detection with 3-shingles
+    @pytest.mark.parametrize("num_articles", [10, 200])
+    def test_similar_articles_removed(self, num_articles):
+        articles, clusters = build_corpus(num_articles, dup_rate=1.0, num_sources=3)
+        originals = [article for name, data in articles.items() if name != "Aggregator" for article in data["articles"]]
+        originals.sort(key=lambda article: int(article["link"].rsplit("/", 1)[1]))
+        # Every reworded copy is above the threshold against its original
+        for original, copy in zip(originals, articles["Aggregator"]["articles"]):
+            assert _jaccard_sets(_article_shingles(original), _article_shingles(copy)) >= 0.7
+        result = _deduplicate_articles(articles, similarity_threshold=0.7)
+        kept = [article["link"] for data in result.values() for article in data["articles"]]
+        # Exactly one article per story cluster survives: the first occurrence
+        assert sorted(kept) == sorted(clusters)
+        assert "Aggregator" not in result
+
+    def test_keeps_first_occurrence(self):
         articles = {
             "Source1": {
                 "articles": [
-                    {"title": "Tesla launches new electric car", "link": "http://a.com", "summary": "Tesla launches new electric car model in California today", "published": ""},
+                    {"title": "First article", "link": "http://a.com", "summary": "This is the first one", "published": ""},
                 ],
                 "categories": ["tech"]
             },
             "Source2": {
                 "articles": [
-                    {"title": "Tesla launches new electric car", "link": "http://b.com", "summary": "Tesla launches new electric car model in California today", "published": ""},
+                    {"title": "First article", "link": "http://b.com", "summary": "This is the first one", "published": ""},
                 ],
                 "categories": ["tech"]
             }
         }
         result = _deduplicate_articles(articles, similarity_threshold=0.7)
-        # Should remove the duplicate
-        total_articles = sum(len(data['articles']) for data in result.values())
-        assert total_articles == 1
+        # Should keep the first source's article
+        assert "Source1" in result
+        assert len(result["Source1"]["articles"]) == 1
 
-    def test_keeps_first_occurrence(self):
+    def test_size_filter_keeps_short_and_long(self):
+        # Shingle counts this far apart can never reach the threshold
         articles = {
             "Source1": {
                 "articles": [
-                    {"title": "First article", "link": "http://a.com", "summary": "This is the first one", "published": ""},
+                    {"title": "Short", "link": "http://a.com", "summary": "A", "published": ""},
                 ],
                 "categories": ["tech"]
             },
             "Source2": {
                 "articles": [
-                    {"title": "First article", "link": "http://b.com", "summary": "This is the first one", "published": ""},
+                    {"title": "Very long article title with many words", "link": "http://b.com", "summary": "This is a much longer summary with lots of text", "published": ""},
                 ],
                 "categories": ["tech"]
             }
         }
         result = _deduplicate_articles(articles, similarity_threshold=0.7)
-        # Should keep the first source's article
-        assert "Source1" in result
-        assert len(result["Source1"]["articles"]) == 1
+        # Both should remain due to length difference
+        total_articles = sum(len(data['articles']) for data in result.values())
+        assert total_articles == 2
 
-    def test_length_filter_optimization(self):
-        # Test that length-based filtering works
+    def test_same_length_different_content_kept(self):
+        # Equal length is no longer a reason to compare: only shared LSH bands are
         articles = {
             "Source1": {
                 "articles": [
-                    {"title": "Short", "link": "http://a.com", "summary": "A", "published": ""},
+                    {"title": "Central bank raises rates", "link": "http://a.com", "summary": "Markets fall after surprise move", "published": ""},
                 ],
-                "categories": ["tech"]
+                "categories": ["business"]
             },
             "Source2": {
                 "articles": [
-                    {"title": "Very long article title with many words", "link": "http://b.com", "summary": "This is a much longer summary with lots of text", "published": ""},
+                    {"title": "Comet spotted over Alaska", "link": "http://b.com", "summary": "Skywatchers share photos online!", "published": ""},
                 ],
-                "categories": ["tech"]
+                "categories": ["science"]
             }
         }
+        first, second = (data["articles"][0] for data in articles.values())
+        assert len(f"{first['title']} {first['summary']}") == len(f"{second['title']} {second['summary']}")
         result = _deduplicate_articles(articles, similarity_threshold=0.7)
-        # Both should remain due to length difference
         total_articles = sum(len(data['articles']) for data in result.values())
         assert total_articles == 2
 
@@ -279,6 +342,24 @@ class TestLoadConfig:
         assert cfg["categories"] == ["tech"]
         assert cfg["sources"] == []
 
+    def test_loads_yaml_from_stream(self):
+        cfg = load_config(io.StringIO("categories:\n  - tech\nsources: []\n"))
+        assert cfg["categories"] == ["tech"]
+        assert cfg["sources"] == []
+
+    def test_cached_until_file_changes(self, tmp_path):
+        cfg_file = tmp_path / "config.yaml"
+        cfg_file.write_text("categories:\n  - tech\n")
+        first = load_config(cfg_file)
+        first["categories"].append("mutated")
+        # Cached parse, but callers get their own copy
+        assert load_config(cfg_file)["categories"] == ["tech"]
+
+        cfg_file.write_text("categories:\n  - world\n")
+        stat = cfg_file.stat()
+        os.utime(cfg_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert load_config(cfg_file)["categories"] == ["world"]
+
     def test_missing_file_raises(self, tmp_path):
         with pytest.raises(FileNotFoundError):
             load_config(str(tmp_path / "missing.yaml"))
@@ -291,6 +372,22 @@ class TestLoadConfig:
 FIXED_DATE = datetime(2024, 3, 15, 8, 0, 0, tzinfo=timezone.utc)
 
 
+MarkdownView = namedtuple("MarkdownView", ["raw", "lines", "links"])
+
+_HREF_RE = re.compile(r'href="([^"]+)"')
+# Source headings: "### 📰 <name>" with an optional "{#anchor}" suffix
+_SOURCE_HEADING_RE = re.compile(r"^### 📰 (.+?)(?: \{#[^}]*\})?$", re.MULTILINE)
+
+
+def _markdown_view(md):
+    """Parse generated markdown once into a MarkdownView.
+
+    *lines* holds every distinct line and *links* every ``href`` target, so
+    assertions are set lookups instead of repeated scans of the whole text.
+    """
+    return MarkdownView(raw=md, lines=frozenset(md.splitlines()), links=set(_HREF_RE.findall(md)))
+
+
 class TestGenerateMarkdown:
     def test_heading_contains_date(self):
         md = generate_markdown(FIXED_DATE, {})
@@ -349,11 +446,11 @@ class TestGenerateMarkdown:
                 "categories": ["world"]
             }
         }
-        md = generate_markdown(FIXED_DATE, news)
+        view = _markdown_view(generate_markdown(FIXED_DATE, news))
         # Links are now HTML with target="_blank"
-        assert '<a href="https://example.com/article" target="_blank">Read Full Article →</a>' in md
-        assert "https://example.com/article" in md
-        assert "Something happened." in md
+        assert '🔗 **<a href="https://example.com/article" target="_blank">Read Full Article →</a>**' in view.lines
+        assert "https://example.com/article" in view.links
+        assert "> Something happened." in view.lines
 
     def test_source_heading_present(self):
         news = {
@@ -364,7 +461,7 @@ class TestGenerateMarkdown:
         }
         md = generate_markdown(FIXED_DATE, news)
         # Source names are now h3 with emoji
-        assert "### 📰 CNN" in md
+        assert _SOURCE_HEADING_RE.findall(md) == ["CNN"]
 
     def test_article_without_link(self):
         news = {
@@ -383,20 +480,28 @@ class TestGenerateMarkdown:
 # fetch_rss (mocked)
 # ---------------------------------------------------------------------------
 
+def _fake_feed(entries):
+    """Build a fake ``feedparser.parse`` result holding *entries*.
+
+    Plain dicts serve as entries: ``fetch_rss`` only calls ``entry.get``.
+    """
+    return SimpleNamespace(entries=list(entries))
+
+
+@pytest.fixture
+def patched_feedparser(mocker):
+    """Patch ``collector.feedparser.parse``; it returns an empty feed unless reconfigured."""
+    return mocker.patch("collector.feedparser.parse", return_value=_fake_feed([]))
+
+
 class TestFetchRss:
-    def test_returns_articles(self, mocker):
-        mock_entry = mocker.MagicMock()
-        mock_entry.get.side_effect = lambda key, default="": {
+    def test_returns_articles(self, patched_feedparser):
+        patched_feedparser.return_value = _fake_feed([{
             "title": "Test Title",
             "link": "https://example.com",
             "summary": "<p>Summary text</p>",
             "published": "Mon, 01 Jan 2024 00:00:00 GMT",
-        }.get(key, default)
-
-        mock_feed = mocker.MagicMock()
-        mock_feed.entries = [mock_entry]
-
-        mocker.patch("collector.feedparser.parse", return_value=mock_feed)
+        }])
 
         articles = fetch_rss("https://example.com/feed", max_items=5)
         assert len(articles) == 1
@@ -405,70 +510,167 @@ class TestFetchRss:
         # HTML should be stripped from summary
         assert "<p>" not in articles[0]["summary"]
 
-    def test_respects_max_items(self, mocker):
-        mock_entry = mocker.MagicMock()
-        mock_entry.get.side_effect = lambda key, default="": {
+    def test_returns_slotted_articles(self, patched_feedparser):
+        patched_feedparser.return_value = _fake_feed([{"title": "T", "link": "https://x.com"}])
+
+        article = fetch_rss("https://example.com/feed")[0]
+        assert isinstance(article, Article)
+        assert not hasattr(article, "__dict__")
+        assert article.title == article["title"] == "T"
+        assert article.get("published") == ""
+        assert article.get("missing", "fallback") == "fallback"
+        with pytest.raises(KeyError):
+            article["missing"]
+
+    @pytest.mark.parametrize("key", ["get", "__class__", "__slots__", "__getitem__"])
+    def test_article_keys_are_only_fields(self, key):
+        article = Article(title="T", link="https://x.com", summary="", published="")
+        assert article.get(key) is None
+        with pytest.raises(KeyError):
+            article[key]
+
+    def test_respects_max_items(self, patched_feedparser):
+        patched_feedparser.return_value = _fake_feed([{
             "title": "T",
             "link": "https://x.com",
             "summary": "",
             "published": "",
-        }.get(key, default)
-
-        mock_feed = mocker.MagicMock()
-        mock_feed.entries = [mock_entry] * 20
-
-        mocker.patch("collector.feedparser.parse", return_value=mock_feed)
+        }] * 20)
 
         articles = fetch_rss("https://example.com/feed", max_items=3)
         assert len(articles) == 3
 
+    def test_fetch_many_keeps_input_order(self, patched_feedparser):
+        urls = [f"https://source{i}.example.com/feed" for i in range(20)]
+        patched_feedparser.side_effect = lambda url: _fake_feed([{"title": url, "link": url}])
+
+        results = fetch_rss_many([(url, 5) for url in urls], max_workers=4)
+        assert [articles[0]["title"] for articles in results] == urls
+
+    def test_fetch_many_returns_errors_in_place(self, patched_feedparser):
+        def parse(url):
+            if "bad" in url:
+                raise OSError("connection reset")
+            return _fake_feed([{"title": "T", "link": url}])
+
+        patched_feedparser.side_effect = parse
+
+        good, bad = fetch_rss_many([("https://good.example.com/feed", 5), ("https://bad.example.com/feed", 5)])
+        assert good[0]["link"] == "https://good.example.com/feed"
+        assert isinstance(bad, OSError)
+
+    def test_html_entities_in_real_feed(self, tmp_path):
+        """Named HTML entities, undeclared in XML, must not cut titles or summaries short."""
+        feed_file = tmp_path / "feed.xml"
+        feed_file.write_text(textwrap.dedent("""\
+            <?xml version="1.0" encoding="UTF-8"?>
+            <rss version="2.0"><channel><title>Feed</title>
+            <item>
+              <title>It&rsquo;s here</title>
+              <link>https://example.com/1</link>
+              <description>Apple&nbsp;unveils the new iPhone&mdash;and more</description>
+            </item>
+            <item>
+              <title>AT&amp;T news from Caf&eacute;</title>
+              <link>https://example.com/2</link>
+              <description>AT&amp;T &lt;b&gt;bold&lt;/b&gt; move</description>
+            </item>
+            </channel></rss>
+        """), encoding="utf-8")
+
+        # Parsed by the real feedparser, not the patched_feedparser mock
+        first, second = fetch_rss(str(feed_file))
+        assert first.title == "It\u2019s here"
+        assert first.summary == "Apple unveils the new iPhone\u2014and more"
+        assert second.title == "AT&T news from Caf\u00e9"
+        assert second.summary == "AT&T bold move"
+
 
 # ---------------------------------------------------------------------------
 # Archive
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="session")
+def shared_docs_root(tmp_path_factory):
+    """One temporary root shared by every archive test in the session."""
+    return tmp_path_factory.mktemp("docs_root")
+
+
+@pytest.fixture
+def docs_dir(shared_docs_root):
+    """A fresh, empty ``docs`` directory under the shared session root."""
+    path = shared_docs_root / uuid.uuid4().hex / "docs"
+    path.mkdir(parents=True)
+    return path
+
+
 class TestArchiveOldFiles:
-    def test_moves_old_files(self, tmp_path):
-        output_dir = tmp_path / "docs"
-        output_dir.mkdir()
-        archive_dir = tmp_path / "docs" / "archive"
+    def test_moves_old_files(self, docs_dir):
+        output_dir = docs_dir
+        archive_dir = docs_dir / "archive"
 
         old_file = output_dir / "2024-01-01.md"
-        old_file.write_text("old content")
+        old_file.write_bytes(b"old content")
 
         run_date = datetime(2024, 3, 15, tzinfo=timezone.utc)
         archive_old_files(output_dir, archive_dir, "2024-03-15.md", "%Y/%m", run_date)
 
         expected_dest = archive_dir / "2024" / "03" / "2024-01-01.md"
-        assert expected_dest.exists()
+        assert expected_dest.read_bytes() == b"old content"
         assert not old_file.exists()
 
-    def test_does_not_move_today_file(self, tmp_path):
-        output_dir = tmp_path / "docs"
-        output_dir.mkdir()
-        archive_dir = tmp_path / "docs" / "archive"
+    def test_does_not_move_today_file(self, docs_dir):
+        output_dir = docs_dir
+        archive_dir = docs_dir / "archive"
 
         today_file = output_dir / "2024-03-15.md"
-        today_file.write_text("today's content")
+        today_file.write_bytes(b"today's content")
 
         run_date = datetime(2024, 3, 15, tzinfo=timezone.utc)
         archive_old_files(output_dir, archive_dir, "2024-03-15.md", "%Y/%m", run_date)
 
         assert today_file.exists()
 
-    def test_does_not_move_readme(self, tmp_path):
-        output_dir = tmp_path / "docs"
-        output_dir.mkdir()
-        archive_dir = tmp_path / "docs" / "archive"
+    def test_does_not_move_readme(self, docs_dir):
+        output_dir = docs_dir
+        archive_dir = docs_dir / "archive"
 
         readme = output_dir / "README.md"
-        readme.write_text("readme")
+        readme.write_bytes(b"readme")
 
         run_date = datetime(2024, 3, 15, tzinfo=timezone.utc)
         archive_old_files(output_dir, archive_dir, "2024-03-15.md", "%Y/%m", run_date)
 
         assert readme.exists()
 
+    def test_ignores_directories_named_like_digests(self, docs_dir):
+        (docs_dir / "2024-03-01.md").mkdir()
+
+        run_date = datetime(2024, 3, 15, tzinfo=timezone.utc)
+        archive_old_files(docs_dir, docs_dir / "archive", "2024-03-15.md", "%Y/%m", run_date)
+
+        assert (docs_dir / "2024-03-01.md").is_dir()
+        assert not (docs_dir / "archive").exists()
+
+    def test_nothing_to_archive_creates_no_dirs(self, docs_dir):
+        (docs_dir / "2024-03-15.md").write_bytes(b"today's content")
+
+        run_date = datetime(2024, 3, 15, tzinfo=timezone.utc)
+        archive_old_files(docs_dir, docs_dir / "archive", "2024-03-15.md", "%Y/%m", run_date)
+
+        assert not (docs_dir / "archive").exists()
+
+    def test_cross_device_falls_back_to_move(self, docs_dir, mocker):
+        old_file = docs_dir / "2024-01-01.md"
+        old_file.write_bytes(b"old content")
+        mocker.patch("collector.os.replace", side_effect=OSError(errno.EXDEV, "Invalid cross-device link"))
+        move = mocker.patch("collector.shutil.move")
+
+        run_date = datetime(2024, 3, 15, tzinfo=timezone.utc)
+        archive_old_files(docs_dir, docs_dir / "archive", "2024-03-15.md", "%Y/%m", run_date)
+
+        move.assert_called_once_with(old_file, docs_dir / "archive" / "2024" / "03" / "2024-01-01.md")
+
 
 # ---------------------------------------------------------------------------
 # Integration-style test for collect_news (fully mocked network)
@@ -499,205 +701,240 @@ _SAMPLE_CONFIG = textwrap.dedent(
 )
 
 
+# Configs for TestCollectNews, serialized once at import time.  The output
+# directories depend on tmp_path, so they are written as placeholders and
+# substituted per test by _config_stream.  JSON is a subset of YAML, so
+# json.dumps gives load_config a valid config without the YAML emitter
+_OUTPUT_DIR = "OUTPUT_DIR_PLACEHOLDER"
+_ARCHIVE_DIR = "ARCHIVE_DIR_PLACEHOLDER"
+
+
+def _rss_source(name, url, categories, enabled=True):
+    return {"name": name, "type": "rss", "url": url, "categories": categories, "enabled": enabled}
+
+
+def _dump_config(categories, sources, archive=None):
+    return json.dumps(
+        {
+            "categories": categories,
+            "sources": sources,
+            "output": {
+                "dir": _OUTPUT_DIR,
+                "archive_dir": _ARCHIVE_DIR,
+                "max_items_per_source": 5,
+            },
+            "archive": archive or {"enabled": False},
+        },
+        ensure_ascii=False,
+    )
+
+
+_TECH_SOURCE = _rss_source("TechSource", "https://tech.example.com/feed", ["technology"])
+_WORLD_SOURCE = _rss_source("WorldSource", "https://world.example.com/feed", ["world"])
+# More sources than config/config.yaml enables, so the all-in-flight test
+# catches a pool smaller than a real config
+_PARALLEL_SOURCES = [
+    _rss_source(f"Source{i}", f"https://source{i}.example.com/feed", ["technology"])
+    for i in range(20)
+]
+
+# Only "world" is enabled, but the single source is a technology one
+_WORLD_ONLY_CFG = _dump_config(["world"], [_TECH_SOURCE])
+_TECH_AND_WORLD_CFG = _dump_config(["world"], [_TECH_SOURCE, _WORLD_SOURCE])
+_ARCHIVE_CFG = _dump_config(
+    ["technology"],
+    [_rss_source("FakeTech", "https://fake.example.com/feed", ["technology"])],
+    archive={"enabled": True, "format": "%Y/%m"},
+)
+_PARALLEL_CFG = _dump_config(
+    ["technology"],
+    _PARALLEL_SOURCES
+    + [_rss_source("DisabledSource", "https://disabled.example.com/feed", ["technology"], enabled=False)],
+)
+
+
+def _json_str(path):
+    """*path* escaped for use inside a JSON (and YAML double-quoted) string."""
+    return json.dumps(str(path))[1:-1]
+
+
+def _config_stream(cfg_text, output_dir, archive_dir):
+    """Return a pre-serialized config as a stream, pointed at the given directories."""
+    return io.StringIO(
+        cfg_text.replace(_OUTPUT_DIR, _json_str(output_dir)).replace(_ARCHIVE_DIR, _json_str(archive_dir))
+    )
+
+
 class TestCollectNews:
-    def test_creates_output_file(self, tmp_path, mocker):
+    def test_creates_output_file(self, tmp_path, patched_feedparser):
         output_dir = tmp_path / "docs"
         archive_dir = tmp_path / "docs" / "archive"
 
         cfg_content = _SAMPLE_CONFIG.format(
             output_dir=str(output_dir), archive_dir=str(archive_dir)
         )
-        cfg_file = tmp_path / "config.yaml"
-        cfg_file.write_text(cfg_content)
+        cfg_file = io.StringIO(cfg_content)
 
         # Mock feedparser so no real HTTP request is made
-        mock_entry = mocker.MagicMock()
-        mock_entry.get.side_effect = lambda key, default="": {
+        patched_feedparser.return_value = _fake_feed([{
             "title": "Tech Article",
             "link": "https://tech.example.com/1",
             "summary": "A cool tech story.",
             "published": "Mon, 15 Mar 2024 08:00:00 GMT",
-        }.get(key, default)
+        }])
 
-        mock_feed = mocker.MagicMock()
-        mock_feed.entries = [mock_entry]
-        mocker.patch("collector.feedparser.parse", return_value=mock_feed)
-
-        output_file = collect_news(str(cfg_file))
+        output_file = collect_news(cfg_file)
 
         assert output_file.exists()
         content = output_file.read_text()
         assert "Tech Article" in content
         assert "https://tech.example.com/1" in content
+        # Written via a temp file that is renamed into place
+        assert not list(output_dir.glob("*.tmp"))
 
-    def test_skips_disabled_source(self, tmp_path, mocker):
+    def test_skips_disabled_source(self, tmp_path, patched_feedparser):
         output_dir = tmp_path / "docs"
         archive_dir = tmp_path / "docs" / "archive"
 
         cfg_content = _SAMPLE_CONFIG.format(
             output_dir=str(output_dir), archive_dir=str(archive_dir)
         )
-        cfg_file = tmp_path / "config.yaml"
-        cfg_file.write_text(cfg_content)
+        cfg_file = io.StringIO(cfg_content)
 
-        mock_feed = mocker.MagicMock()
-        mock_feed.entries = []
-        mock_parse = mocker.patch("collector.feedparser.parse", return_value=mock_feed)
-
-        collect_news(str(cfg_file))
+        collect_news(cfg_file)
 
         # feedparser.parse should only be called for the enabled source
-        called_urls = [call.args[0] for call in mock_parse.call_args_list]
+        called_urls = {call.args[0] for call in patched_feedparser.call_args_list}
         assert "https://disabled.example.com/feed" not in called_urls
 
-    def test_category_filter_excludes_source(self, tmp_path, mocker):
+    def test_category_filter_excludes_source(self, tmp_path, patched_feedparser):
         """A source whose categories don't overlap with enabled categories is skipped."""
         output_dir = tmp_path / "docs"
         archive_dir = tmp_path / "docs" / "archive"
 
-        cfg = {
-            "categories": ["world"],  # only world
-            "sources": [
-                {
-                    "name": "TechSource",
-                    "type": "rss",
-                    "url": "https://tech.example.com/feed",
-                    "categories": ["technology"],
-                    "enabled": True,
-                }
-            ],
-            "output": {
-                "dir": str(output_dir),
-                "archive_dir": str(archive_dir),
-                "max_items_per_source": 5,
-            },
-            "archive": {"enabled": False},
-        }
-        cfg_file = tmp_path / "config.yaml"
-        cfg_file.write_text(yaml.dump(cfg))
-
-        mock_parse = mocker.patch("collector.feedparser.parse")
+        cfg_file = _config_stream(_WORLD_ONLY_CFG, output_dir, archive_dir)
 
-        collect_news(str(cfg_file))
+        collect_news(cfg_file)
 
         # feedparser should never have been called
-        mock_parse.assert_not_called()
+        patched_feedparser.assert_not_called()
+
+    def test_source_listed_under_first_configured_category(self, tmp_path, patched_feedparser):
+        output_dir = tmp_path / "docs"
+        archive_dir = tmp_path / "docs" / "archive"
+        cfg_text = _dump_config(
+            ["world", "business"],
+            [_rss_source("Wire", "https://wire.example.com/feed", ["world", "business", "world"])],
+        )
+        patched_feedparser.return_value = _fake_feed([{"title": "Story", "link": "https://wire.example.com/1"}])
+
+        content = collect_news(_config_stream(cfg_text, output_dir, archive_dir)).read_text()
+
+        assert "## 🌍 World News" in content
+        assert "## 💼 Business & Finance" not in content
 
-    def test_archive_enabled_moves_old_files(self, tmp_path, mocker):
+    def test_source_without_url_is_skipped(self, tmp_path, patched_feedparser, capsys):
+        """A source missing its url is reported and skipped; the others are still collected."""
         output_dir = tmp_path / "docs"
-        output_dir.mkdir()
         archive_dir = tmp_path / "docs" / "archive"
+        no_url = _rss_source("Broken", None, ["world"])
+        del no_url["url"]
+        cfg_text = _dump_config(["world"], [no_url, _rss_source("Wire", "https://wire.example.com/feed", ["world"])])
+        patched_feedparser.return_value = _fake_feed([{"title": "Story", "link": "https://wire.example.com/1"}])
+
+        content = collect_news(_config_stream(cfg_text, output_dir, archive_dir)).read_text()
+
+        patched_feedparser.assert_called_once_with("https://wire.example.com/feed")
+        assert "### 📰 Wire " in content
+        assert "Broken" not in content
+        assert "⚠ Failed to fetch Broken" in capsys.readouterr().err
+
+    def test_archive_enabled_moves_old_files(self, docs_dir, patched_feedparser):
+        output_dir = docs_dir
+        archive_dir = docs_dir / "archive"
 
         old_file = output_dir / "2020-01-01.md"
-        old_file.write_text("old")
-
-        cfg = {
-            "categories": ["technology"],
-            "sources": [
-                {
-                    "name": "FakeTech",
-                    "type": "rss",
-                    "url": "https://fake.example.com/feed",
-                    "categories": ["technology"],
-                    "enabled": True,
-                }
-            ],
-            "output": {
-                "dir": str(output_dir),
-                "archive_dir": str(archive_dir),
-                "max_items_per_source": 5,
-            },
-            "archive": {"enabled": True, "format": "%Y/%m"},
-        }
-        cfg_file = tmp_path / "config.yaml"
-        cfg_file.write_text(yaml.dump(cfg))
+        old_file.write_bytes(b"old")
 
-        mock_feed = mocker.MagicMock()
-        mock_feed.entries = []
-        mocker.patch("collector.feedparser.parse", return_value=mock_feed)
+        cfg_file = _config_stream(_ARCHIVE_CFG, output_dir, archive_dir)
 
-        collect_news(str(cfg_file))
+        collect_news(cfg_file)
 
         # The old file should have been moved to the archive
         assert not old_file.exists()
 
-    def test_categories_override_takes_precedence(self, tmp_path, mocker):
+    def test_categories_override_takes_precedence(self, tmp_path, patched_feedparser):
         """categories_override replaces the config's categories list."""
         output_dir = tmp_path / "docs"
         archive_dir = tmp_path / "docs" / "archive"
 
         # Config says "world" only, but we override to "technology"
-        cfg = {
-            "categories": ["world"],
-            "sources": [
-                {
-                    "name": "TechSource",
-                    "type": "rss",
-                    "url": "https://tech.example.com/feed",
-                    "categories": ["technology"],
-                    "enabled": True,
-                },
-                {
-                    "name": "WorldSource",
-                    "type": "rss",
-                    "url": "https://world.example.com/feed",
-                    "categories": ["world"],
-                    "enabled": True,
-                },
-            ],
-            "output": {
-                "dir": str(output_dir),
-                "archive_dir": str(archive_dir),
-                "max_items_per_source": 5,
-            },
-            "archive": {"enabled": False},
-        }
-        cfg_file = tmp_path / "config.yaml"
-        cfg_file.write_text(yaml.dump(cfg))
-
-        mock_feed = mocker.MagicMock()
-        mock_feed.entries = []
-        mock_parse = mocker.patch("collector.feedparser.parse", return_value=mock_feed)
+        cfg_file = _config_stream(_TECH_AND_WORLD_CFG, output_dir, archive_dir)
 
         # Override to technology only
-        collect_news(str(cfg_file), categories_override=["technology"])
+        collect_news(cfg_file, categories_override=["technology"])
 
-        called_urls = [call.args[0] for call in mock_parse.call_args_list]
-        assert "https://tech.example.com/feed" in called_urls
+        # Feeds are fetched concurrently, so compare URLs as a set
+        called_urls = {call.args[0] for call in patched_feedparser.call_args_list}
+        assert called_urls >= {"https://tech.example.com/feed"}
         assert "https://world.example.com/feed" not in called_urls
 
-    def test_categories_override_empty_list_collects_all(self, tmp_path, mocker):
+    def test_categories_override_empty_list_collects_all(self, tmp_path, patched_feedparser):
         """An empty categories_override list means no category filter is applied."""
         output_dir = tmp_path / "docs"
         archive_dir = tmp_path / "docs" / "archive"
 
-        cfg = {
-            "categories": ["world"],
-            "sources": [
-                {
-                    "name": "TechSource",
-                    "type": "rss",
-                    "url": "https://tech.example.com/feed",
-                    "categories": ["technology"],
-                    "enabled": True,
-                },
-            ],
-            "output": {
-                "dir": str(output_dir),
-                "archive_dir": str(archive_dir),
-                "max_items_per_source": 5,
-            },
-            "archive": {"enabled": False},
-        }
-        cfg_file = tmp_path / "config.yaml"
-        cfg_file.write_text(yaml.dump(cfg))
-
-        mock_feed = mocker.MagicMock()
-        mock_feed.entries = []
-        mock_parse = mocker.patch("collector.feedparser.parse", return_value=mock_feed)
+        cfg_file = _config_stream(_WORLD_ONLY_CFG, output_dir, archive_dir)
 
         # Empty override → no category filtering → tech source is fetched
-        collect_news(str(cfg_file), categories_override=[])
+        collect_news(cfg_file, categories_override=[])
+
+        called_urls = {call.args[0] for call in patched_feedparser.call_args_list}
+        assert called_urls >= {"https://tech.example.com/feed"}
+
+    def test_parallel_fetch_invokes_all(self, tmp_path, mocker, patched_feedparser):
+        """Every enabled source is fetched exactly once, and output keeps config order."""
+        # No live translation calls: only the fetch fan-out is under test
+        mocker.patch("collector.Translator", return_value=None)
+        output_dir = tmp_path / "docs"
+        archive_dir = tmp_path / "docs" / "archive"
+
+        cfg_file = _config_stream(_PARALLEL_CFG, output_dir, archive_dir)
+
+        patched_feedparser.side_effect = lambda url: _fake_feed([{
+            "title": f"Story from {url}",
+            "link": url.replace("/feed", "/1"),
+            "summary": f"Unique summary for {url}",
+        }])
+
+        output_file = collect_news(cfg_file)
+
+        assert patched_feedparser.call_count == len(_PARALLEL_SOURCES)
+        called_urls = {call.args[0] for call in patched_feedparser.call_args_list}
+        assert called_urls == {src["url"] for src in _PARALLEL_SOURCES}
+        content = output_file.read_text()
+        positions = [content.index(f"### 📰 {src['name']} ") for src in _PARALLEL_SOURCES]
+        assert positions == sorted(positions)
+
+    def test_all_feeds_in_flight_at_once(self, tmp_path, mocker, patched_feedparser):
+        """Feeds are not fetched in waves: every fetch starts before any finishes."""
+        # No live translation calls: only the fetch fan-out is under test
+        mocker.patch("collector.Translator", return_value=None)
+        output_dir = tmp_path / "docs"
+        archive_dir = tmp_path / "docs" / "archive"
+        cfg_file = _config_stream(_PARALLEL_CFG, output_dir, archive_dir)
+
+        # Each fake fetch blocks until all of them have started; a timeout
+        # breaks the barrier, failing the fetches and dropping their sections
+        barrier = threading.Barrier(len(_PARALLEL_SOURCES), timeout=5)
+
+        def slow_parse(url):
+            barrier.wait()
+            return _fake_feed([{"title": f"Story from {url}", "link": url, "summary": url}])
+
+        patched_feedparser.side_effect = slow_parse
+
+        content = collect_news(cfg_file).read_text()
 
-        called_urls = [call.args[0] for call in mock_parse.call_args_list]
-        assert "https://tech.example.com/feed" in called_urls
+        for src in _PARALLEL_SOURCES:
+            assert f"### 📰 {src['name']} " in content
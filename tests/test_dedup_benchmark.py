@@ -0,0 +1,31 @@
+"""
+Scaling benchmark for the MinHash-LSH dedup in src/collector.py
+
+Skipped unless pytest-benchmark is installed.  Run with:
+
+    pytest tests/test_dedup_benchmark.py --benchmark-only
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from collector import _deduplicate_articles, _generate_shingles
+from corpus import build_corpus
+
+
+@pytest.mark.benchmark(group="dedup")
+@pytest.mark.parametrize("n", [100, 1000, 5000])
+def test_dedup_scales(benchmark, n):
+    corpus, _ = build_corpus(n)
+    # Start every round with a cold shingle cache, as a fresh collector run would
+    benchmark.pedantic(
+        _deduplicate_articles,
+        args=(corpus, 0.7),
+        setup=_generate_shingles.cache_clear,
+        rounds=3,
+    )
+    # Linear in n: about 2 ms per article leaves headroom for slow machines
+    # while still catching a return to all-pairs comparison (~7 ms per article
+    # at n=5000)
+    assert benchmark.stats["mean"] < n * 2e-3
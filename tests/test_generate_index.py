@@ -4,14 +4,10 @@ Tests for src/generate_index.py
 Run with:  pytest tests/
 """
 
-import sys
 from datetime import datetime
 from pathlib import Path
 
-# Make the src package importable without an install step
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from generate_index import generate_period_index  # noqa: E402
+from generate_index import generate_period_index
 
 
 def test_period_index_links_to_root_digest(tmp_path: Path):
@@ -4,20 +4,24 @@ Tests for src/generate_summary.py
 Run with:  pytest tests/
 """
 
+import hashlib
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
 
 import pytest
 
-# Make the src package importable without an install step
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from generate_summary import (  # noqa: E402
+from generate_summary import (
     parse_digest_file,
+    parse_many,
     generate_digest_summary,
     generate_period_summary,
     generate_summary_index,
+    _summary_is_fresh,
+    _digest_manifest,
+    _render_and_write,
+    _parse_date,
 )
 
 
@@ -115,6 +119,24 @@ title: 📰 Daily News Digest · 2026-02-24
         assert '🔬 Technology & AI' in result['categories']
         assert '💼 Business & Finance' in result['categories']
 
+    def test_summary_lookahead_is_bounded(self, tmp_path):
+        """Only quote lines close below an article header count as its summary."""
+        digest_content = (
+            "## 🔬 Technology & AI {#technology-ai}\n\n"
+            "### 📰 TechCrunch {#techcrunch}\n\n"
+            "#### 1. Near Summary\n\n"
+            "> Close enough.\n\n"
+            "#### 2. Far Summary\n"
+            + "\n" * 10
+            + "> Too far away.\n"
+        )
+        digest_file = tmp_path / "2026-02-24.md"
+        digest_file.write_text(digest_content, encoding='utf-8')
+
+        articles = parse_digest_file(digest_file)['categories']['🔬 Technology & AI']['articles']
+
+        assert [a['summary'] for a in articles] == ['Close enough.', '']
+
     def test_invalid_filename_returns_none(self, tmp_path):
         """Test that invalid filename returns None."""
         digest_file = tmp_path / "invalid-name.md"
@@ -143,6 +165,102 @@ title: 📰 Daily News Digest · 2026-02-24
         assert result['article_count'] == 0
         assert len(result['categories']) == 0
 
+    @pytest.mark.parametrize("date_str", ["2026-02-24", "2024-02-29", "1999-12-31"])
+    def test_parse_date_matches_strptime(self, date_str):
+        """Slicing parser agrees with strptime on valid dates."""
+        assert _parse_date(date_str) == datetime.strptime(date_str, '%Y-%m-%d')
+
+    def test_parse_date_rejects_invalid_day(self):
+        """Impossible calendar dates still raise ValueError."""
+        with pytest.raises(ValueError):
+            _parse_date("2026-02-30")
+
+
+# ---------------------------------------------------------------------------
+# Test parse_many
+# ---------------------------------------------------------------------------
+
+class TestParseMany:
+    def _write_digests(self, tmp_path, count):
+        paths = []
+        for day in range(1, count + 1):
+            path = tmp_path / f"2026-02-{day:02d}.md"
+            path.write_text(
+                "## 🔬 Technology & AI {#technology-ai}\n\n"
+                "### 📰 TechCrunch {#techcrunch}\n\n"
+                f"#### 1. Story {day}\n\n> Summary {day}.\n",
+                encoding='utf-8',
+            )
+            paths.append(path)
+        return paths
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_matches_serial_parse(self, tmp_path, max_workers):
+        """The pooled and in-process paths return the same digests in input order."""
+        paths = self._write_digests(tmp_path, 6)
+        invalid = tmp_path / "notes.md"
+        invalid.write_text("content", encoding='utf-8')
+
+        result = parse_many(paths[:3] + [invalid] + paths[3:], max_workers=max_workers)
+
+        assert result == [parse_digest_file(path) for path in paths]
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_cached_parse_matches_uncached(self, tmp_path, max_workers):
+        paths = self._write_digests(tmp_path, 6)
+        cache_dir = tmp_path / ".cache"
+        expected = [parse_digest_file(path) for path in paths]
+
+        # First run fills the cache, the second is served from it
+        assert parse_many(paths, max_workers=max_workers, cache_dir=cache_dir) == expected
+        assert len(list(cache_dir.glob("*.pickle"))) == 6
+        assert parse_many(paths, max_workers=max_workers, cache_dir=cache_dir) == expected
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_names_shared_across_digests(self, tmp_path, max_workers):
+        """Category and source names stay interned through worker processes and cache hits."""
+        paths = self._write_digests(tmp_path, 6)
+        cache_dir = tmp_path / ".cache"
+        parse_many(paths, max_workers=max_workers, cache_dir=cache_dir)
+
+        parsed = parse_many(paths, max_workers=max_workers)
+        cached = parse_many(paths, max_workers=max_workers, cache_dir=cache_dir)
+        for result in (parsed, cached):
+            names = set()
+            for digest in result:
+                (category, info), = digest['categories'].items()
+                names.update(map(id, (category, info['sources'][0], info['articles'][0]['source'])))
+            assert names == {id(sys.intern("🔬 Technology & AI")), id(sys.intern("TechCrunch"))}
+
+    def test_cache_hit_skips_parsing(self, tmp_path, mocker):
+        path, = self._write_digests(tmp_path, 1)
+        cache_dir = tmp_path / ".cache"
+        expected = parse_digest_file(path, cache_dir=cache_dir)
+
+        parse_lines = mocker.patch("generate_summary._parse_digest_lines")
+        assert parse_digest_file(path, cache_dir=cache_dir) == expected
+        parse_lines.assert_not_called()
+
+    def test_known_hash_hit_does_not_read_file(self, tmp_path):
+        """With the content hash passed in, a cache hit never opens the digest."""
+        path, = self._write_digests(tmp_path, 1)
+        cache_dir = tmp_path / ".cache"
+        content_hash = hashlib.sha1(path.read_bytes()).hexdigest()
+        expected = parse_digest_file(path, cache_dir=cache_dir)
+
+        path.unlink()
+
+        assert parse_digest_file(path, cache_dir=cache_dir, content_hash=content_hash) == expected
+
+    def test_edited_digest_misses_cache(self, tmp_path):
+        path, = self._write_digests(tmp_path, 1)
+        cache_dir = tmp_path / ".cache"
+        parse_digest_file(path, cache_dir=cache_dir)
+
+        path.write_text(path.read_text(encoding='utf-8') + "#### 2. Late story\n", encoding='utf-8')
+
+        assert parse_digest_file(path, cache_dir=cache_dir)['article_count'] == 2
+
 
 # ---------------------------------------------------------------------------
 # Test generate_digest_summary
@@ -365,3 +483,83 @@ class TestGenerateSummaryIndex:
         index = generate_summary_index(all_summaries)
 
         assert '[← Back to Home](../../)' in index
+
+
+# ---------------------------------------------------------------------------
+# Test _summary_is_fresh
+# ---------------------------------------------------------------------------
+
+class TestSummaryIsFresh:
+    """A summary is fresh only if it was built from the same digests, at the same paths."""
+
+    def _digest(self, path: Path, text: str = "## 🔬 Technology & AI {#technology-ai}\n") -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding='utf-8')
+        return path
+
+    def _build(self, docs_dir: Path, digests: list[Path]) -> Path:
+        """Write the March 2026 summary (and its manifest) the way main() does."""
+        archive_dir = docs_dir / "archive"
+        period_digests = [parse_digest_file(path) for path in digests]
+        _render_and_write(2026, 3, period_digests, archive_dir, docs_dir, _digest_manifest(digests, docs_dir))
+        return archive_dir / "2026" / "03" / "summary.md"
+
+    def test_missing_summary_is_stale(self, tmp_path):
+        """A period without a summary.md always needs generating."""
+        digest = self._digest(tmp_path / "2026-03-30.md")
+        assert not _summary_is_fresh(tmp_path / "summary.md", _digest_manifest([digest], tmp_path))
+
+    def test_summary_without_manifest_is_stale(self, tmp_path):
+        """Summaries written before manifests existed are rebuilt once."""
+        digest = self._digest(tmp_path / "2026-03-30.md")
+        summary = self._build(tmp_path, [digest])
+        (summary.parent / ".summary-digests").unlink()
+        assert not _summary_is_fresh(summary, _digest_manifest([digest], tmp_path))
+
+    def test_unchanged_digests_are_fresh(self, tmp_path):
+        """Rebuilding is skipped when nothing changed, whatever the file mtimes."""
+        digests = [self._digest(tmp_path / "2026-03-30.md"), self._digest(tmp_path / "2026-03-31.md")]
+        summary = self._build(tmp_path, digests)
+        # A fresh checkout can leave digests newer than their summary
+        os.utime(summary, (1000, 1000))
+        assert _summary_is_fresh(summary, _digest_manifest(digests, tmp_path))
+
+    def test_added_digest_makes_summary_stale(self, tmp_path):
+        first = self._digest(tmp_path / "2026-03-30.md")
+        summary = self._build(tmp_path, [first])
+        second = self._digest(tmp_path / "2026-03-31.md")
+        assert not _summary_is_fresh(summary, _digest_manifest([first, second], tmp_path))
+
+    def test_edited_digest_makes_summary_stale(self, tmp_path):
+        digest = self._digest(tmp_path / "2026-03-30.md")
+        summary = self._build(tmp_path, [digest])
+        self._digest(digest, "## 💼 Business & Finance {#business-finance}\n")
+        assert not _summary_is_fresh(summary, _digest_manifest([digest], tmp_path))
+
+    def test_format_version_bump_makes_summary_stale(self, tmp_path, monkeypatch):
+        """Summaries rendered by an older template are rebuilt."""
+        digest = self._digest(tmp_path / "2026-03-30.md")
+        summary = self._build(tmp_path, [digest])
+        monkeypatch.setattr("generate_summary.SUMMARY_FORMAT_VERSION", "summary-test-bumped")
+        assert not _summary_is_fresh(summary, _digest_manifest([digest], tmp_path))
+
+    def test_moved_digest_makes_summary_stale(self, tmp_path):
+        """Archiving a digest keeps its mtime but breaks the summary's links to it."""
+        digests = [self._digest(tmp_path / "2026-03-30.md"), self._digest(tmp_path / "2026-03-31.md")]
+        summary = self._build(tmp_path, digests)
+        assert "../../../2026-03-31.html" in summary.read_text(encoding='utf-8')
+
+        # Archived at the start of April, mtimes preserved as by os.replace
+        moved = []
+        (tmp_path / "archive" / "2026" / "04").mkdir(parents=True)
+        for digest in digests:
+            dest = tmp_path / "archive" / "2026" / "04" / digest.name
+            os.replace(digest, dest)
+            moved.append(dest)
+
+        manifest = _digest_manifest(moved, tmp_path)
+        assert not _summary_is_fresh(summary, manifest)
+
+        summary = self._build(tmp_path, moved)
+        assert "../../../2026-03-31.html" not in summary.read_text(encoding='utf-8')
+        assert _summary_is_fresh(summary, manifest)
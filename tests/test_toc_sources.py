@@ -5,39 +5,55 @@ This ensures that when news sources are added/removed from the config,
 the TOC automatically includes appropriate source-level links.
 """
 
-import sys
 from datetime import datetime, timezone
-from pathlib import Path
 
 import pytest
 
-# Make the src package importable
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from collector import generate_markdown, _create_anchor  # noqa: E402
+from collector import generate_markdown, _create_anchor
 
 
 class TestCreateAnchor:
     """Test the anchor generation helper."""
 
-    def test_removes_emojis(self):
-        assert _create_anchor("📰 NASA Breaking News") == "nasa-breaking-news"
-        assert _create_anchor("🔬 Technology & AI") == "technology-ai"
+    @pytest.mark.parametrize("raw, expected", [
+        ("📰 NASA Breaking News", "nasa-breaking-news"),        # removes emojis
+        ("🔬 Technology & AI", "technology-ai"),
+        ("Stack Overflow Blog", "stack-overflow-blog"),         # special characters
+        ("Dev.to", "devto"),
+        ("Business & Finance", "business-finance"),             # ampersands
+        ("Multiple   Spaces   Here", "multiple-spaces-here"),   # runs of spaces
+        ("Test--Multiple---Hyphens", "test-multiple-hyphens"),  # runs of hyphens
+        ("36氪 Tech_News\tDaily", "36-technewsdaily"),          # non-ASCII, '_' and tabs dropped
+        ("Café — Über", "caf-ber"),
+        ("techcrunch2", "techcrunch2"),                         # already a slug
+        ("2024", "2024"),
+    ])
+    def test_create_anchor(self, raw, expected):
+        assert _create_anchor(raw) == expected
+
+
+def _article(link):
+    return {"title": "T", "link": link, "summary": "S", "published": ""}
 
-    def test_handles_special_characters(self):
-        assert _create_anchor("Stack Overflow Blog") == "stack-overflow-blog"
-        assert _create_anchor("Dev.to") == "devto"
 
-    def test_removes_ampersands(self):
-        assert _create_anchor("Business & Finance") == "business-finance"
+# One source in each digest category
+_ALL_CATEGORIES_NEWS = {
+    "TechCrunch": {"articles": [_article("http://a.com")], "categories": ["technology"]},
+    "Dev.to": {"articles": [_article("http://b.com")], "categories": ["coding"]},
+    "Financial Times": {"articles": [_article("http://c.com")], "categories": ["business"]},
+    "BBC News": {"articles": [_article("http://d.com")], "categories": ["world"]},
+    "WHO News": {"articles": [_article("http://e.com")], "categories": ["health"]},
+    "NASA Breaking News": {"articles": [_article("http://f.com")], "categories": ["science"]},
+}
 
-    def test_multiple_spaces(self):
-        assert _create_anchor("Multiple   Spaces   Here") == "multiple-spaces-here"
 
-    def test_consecutive_hyphens(self):
-        # After removing special chars, we might get consecutive hyphens
-        result = _create_anchor("Test--Multiple---Hyphens")
-        assert result == "test-multiple-hyphens"
+def _missing_lines(md, expected):
+    """Return the lines of *expected* that are not whole lines of *md*.
+
+    One split of the document answers every lookup, and a failing assert
+    shows exactly which lines are missing.
+    """
+    return set(expected) - set(md.splitlines())
 
 
 class TestTocSourceLinks:
@@ -73,13 +89,11 @@ class TestTocSourceLinks:
         date = datetime(2026, 2, 24, tzinfo=timezone.utc)
         md = generate_markdown(date, news, translator=None)
 
-        # Check that TOC contains source links
-        assert "- [TechCrunch](#techcrunch)" in md
-        assert "- [NASA Breaking News](#nasa-breaking-news)" in md
-
-        # Check that sources are indented (nested under categories)
-        assert "  - [TechCrunch](#techcrunch)" in md
-        assert "  - [NASA Breaking News](#nasa-breaking-news)" in md
+        # Check that TOC contains source links, indented (nested under categories)
+        assert not _missing_lines(md, {
+            "  - [TechCrunch](#techcrunch)",
+            "  - [NASA Breaking News](#nasa-breaking-news)",
+        })
 
     def test_source_anchors_match_headings(self):
         """Source anchor links should match the actual source headings."""
@@ -147,9 +161,11 @@ class TestTocSourceLinks:
         md = generate_markdown(date, news, translator=None)
 
         # All three sources should appear
-        assert "  - [Source1](#source1)" in md
-        assert "  - [Source2](#source2)" in md
-        assert "  - [Source3](#source3)" in md
+        assert not _missing_lines(md, {
+            "  - [Source1](#source1)",
+            "  - [Source2](#source2)",
+            "  - [Source3](#source3)",
+        })
 
     def test_empty_articles_not_in_toc(self):
         """Sources with no articles should not appear in TOC."""
@@ -178,63 +194,25 @@ class TestTocSourceLinks:
 
     def test_toc_structure_with_all_categories(self):
         """Verify TOC structure when all categories have sources."""
-        news = {
-            "TechCrunch": {
-                "articles": [
-                    {"title": "T", "link": "http://a.com", "summary": "S", "published": ""}
-                ],
-                "categories": ["technology"],
-            },
-            "Dev.to": {
-                "articles": [
-                    {"title": "T", "link": "http://b.com", "summary": "S", "published": ""}
-                ],
-                "categories": ["coding"],
-            },
-            "Financial Times": {
-                "articles": [
-                    {"title": "T", "link": "http://c.com", "summary": "S", "published": ""}
-                ],
-                "categories": ["business"],
-            },
-            "BBC News": {
-                "articles": [
-                    {"title": "T", "link": "http://d.com", "summary": "S", "published": ""}
-                ],
-                "categories": ["world"],
-            },
-            "WHO News": {
-                "articles": [
-                    {"title": "T", "link": "http://e.com", "summary": "S", "published": ""}
-                ],
-                "categories": ["health"],
-            },
-            "NASA Breaking News": {
-                "articles": [
-                    {"title": "T", "link": "http://f.com", "summary": "S", "published": ""}
-                ],
-                "categories": ["science"],
-            },
-        }
-
         date = datetime(2026, 2, 24, tzinfo=timezone.utc)
-        md = generate_markdown(date, news, translator=None)
-
-        # Verify TOC has all categories
-        assert "🔬 Technology & AI" in md
-        assert "💻 Coding & Development" in md
-        assert "💼 Business & Finance" in md
-        assert "🌍 World News" in md
-        assert "🏥 Health" in md
-        assert "🔭 Science" in md
-
-        # Verify TOC has all sources nested under categories
-        assert "  - [TechCrunch](#techcrunch)" in md
-        assert "  - [Dev.to](#devto)" in md
-        assert "  - [Financial Times](#financial-times)" in md
-        assert "  - [BBC News](#bbc-news)" in md
-        assert "  - [WHO News](#who-news)" in md
-        assert "  - [NASA Breaking News](#nasa-breaking-news)" in md
+        md = generate_markdown(date, _ALL_CATEGORIES_NEWS, translator=None)
+
+        # Every category is listed, with every source nested under it
+        expected = {
+            "- [🔬 Technology & AI](#technology-ai)",
+            "  - [TechCrunch](#techcrunch)",
+            "- [💻 Coding & Development](#coding-development)",
+            "  - [Dev.to](#devto)",
+            "- [💼 Business & Finance](#business-finance)",
+            "  - [Financial Times](#financial-times)",
+            "- [🌍 World News](#world-news)",
+            "  - [BBC News](#bbc-news)",
+            "- [🏥 Health](#health)",
+            "  - [WHO News](#who-news)",
+            "- [🔭 Science](#science)",
+            "  - [NASA Breaking News](#nasa-breaking-news)",
+        }
+        assert not _missing_lines(md, expected)
 
     def test_config_changes_reflected_in_toc(self):
         """When sources change in config, TOC should update automatically."""
@@ -257,6 +235,8 @@ class TestTocSourceLinks:
         date = datetime(2026, 2, 24, tzinfo=timezone.utc)
         md = generate_markdown(date, news_with_new_source, translator=None)
 
-        # New source should appear in TOC
-        assert "- [NewTechBlog](#newtechblog)" in md
-        assert "### 📰 NewTechBlog" in md
+        # New source should appear in TOC and as a section
+        assert not _missing_lines(md, {
+            "  - [NewTechBlog](#newtechblog)",
+            "### 📰 NewTechBlog {#newtechblog}",
+        })